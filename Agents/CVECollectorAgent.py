@@ -10,16 +10,37 @@ Installation:
 
 # ==================== IMPORTS ====================
 from agno.agent import Agent
-from agno.models.ollama import Ollama
+from Agents.OllamaModel import get_ollama_model
 from agno.tools.website import WebsiteTools
+import hashlib
 import httpx
+import orjson
+from ciso8601 import parse_datetime
 from datetime import datetime
-from Database import CVE, HackingNews, AgentRun
+from Database import CVE, HackingNews, AgentRun, FeedCache
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# NIST 1.1 feeds polled on every run: recently published CVEs (last ~8 days)
+# and recently modified ones, which also picks up entries published earlier
+# that the database has not seen yet
+NVD_FEED_URLS = (
+    "https://nvd.nist.gov/feeds/json/cve/1.1/nvdcve-1.1-recent.json",
+    "https://nvd.nist.gov/feeds/json/cve/1.1/nvdcve-1.1-modified.json",
+)
+
+# Built once at import and run as an executemany, so every run reuses the
+# cached compiled statement; RETURNING yields only the rows actually inserted
+_INSERT_CVE = (
+    pg_insert(CVE.__table__)
+    .on_conflict_do_nothing(index_elements=["cve_id"])
+    .returning(CVE.__table__.c.cve_id)
+)
+
 
 class CVECollectorAgent:
     """
@@ -28,9 +49,9 @@ class CVECollectorAgent:
 
     Strategy:
     1. Get last CVE ID from database
-    2. Fetch recent CVEs JSON from NIST
-    3. Loop through and skip entries already in database
-    4. Insert only new CVEs
+    2. Fetch recent and modified CVEs JSON from NIST (concurrently)
+    3. Insert all entries with ON CONFLICT DO NOTHING
+    4. Postgres skips CVEs already in database
     """
 
     def __init__(self, model_name: str = "llama3.2:3b"):
@@ -42,11 +63,7 @@ class CVECollectorAgent:
         """
         self.agent = Agent(
             name="cve-collector",
-            model=Ollama(
-                id="llama3.2:3b",
-                host="http://192.168.1.155:11434",
-                timeout=120
-            ),
+            model=get_ollama_model(model_name),
             tools=[WebsiteTools()],
             instructions="""
             You are a CVE intelligence agent. Your job is to:
@@ -62,6 +79,17 @@ class CVECollectorAgent:
             markdown=True
         )
 
+        # Persistent HTTP/2 client: keeps the NVD connection alive across runs
+        self._http = httpx.Client(
+            http2=True,
+            timeout=60,
+            headers={"User-Agent": "ACSAT/1.0"}
+        )
+
+    def close(self):
+        """Close the HTTP connection pool"""
+        self._http.close()
+
     def run(self, db: Session) -> dict:
         """
         Main execution method for the CVE collector agent.
@@ -132,59 +160,128 @@ class CVECollectorAgent:
             logger.warning(f"Could not get last CVE ID: {e}")
             return None
 
+    def _download_feed(self, url: str, headers: dict) -> tuple:
+        """
+        Download one NIST JSON feed and return its CVE items.
+
+        Sends the cached validators as a conditional GET, so an unchanged
+        feed costs a 304 with an empty body instead of a full download.
+
+        Args:
+            url (str): Feed URL
+            headers (dict): Cached validators (etag, last_modified, body_sha256)
+
+        Returns:
+            tuple: (CVE_Items entries, validators to cache) - items are empty
+            and validators None when the feed has not changed
+        """
+        feed_name = url.rsplit("/", 1)[-1]
+        logger.info(f"Fetching CVEs from NIST: {url}")
+
+        request_headers = {}
+        if headers.get("etag"):
+            request_headers["If-None-Match"] = headers["etag"]
+        if headers.get("last_modified"):
+            request_headers["If-Modified-Since"] = headers["last_modified"]
+
+        response = self._http.get(url, headers=request_headers)
+        if response.status_code == 304:
+            logger.info(f"NIST feed {feed_name} not modified since last run")
+            return [], None
+        response.raise_for_status()
+
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_sha256": hashlib.sha256(response.content).hexdigest()
+        }
+
+        # Servers without validators still get the parse skipped on an identical body
+        if validators["body_sha256"] == headers.get("body_sha256"):
+            logger.info(f"NIST feed {feed_name} unchanged since last run")
+            return [], validators
+
+        cve_items = orjson.loads(response.content).get("CVE_Items", [])
+        logger.info(f"NIST feed {feed_name} contains {len(cve_items)} CVE items")
+        return cve_items, validators
+
+    def _load_feed_cache(self, db: Session) -> dict:
+        """
+        Load cached validators for the NIST feeds.
+
+        Args:
+            db (Session): Database session
+
+        Returns:
+            dict: FeedCache row per feed URL (only feeds fetched before)
+        """
+        rows = db.query(FeedCache).filter(FeedCache.url.in_(NVD_FEED_URLS)).all()
+        return {row.url: row for row in rows}
+
     def _fetch_nvd_feed(self, db: Session, last_cve_id: str = None) -> list:
         """
-        Fetch CVE data from NIST recent JSON feed.
+        Fetch CVE data from the NIST recent and modified JSON feeds.
         Skip CVEs that already exist in database.
 
         Process:
-        1. Fetch recent CVEs JSON from NIST
-        2. Loop through each CVE item
-        3. Check if CVE ID already exists in database
-        4. If exists: skip it
-        5. If new: parse and insert into database
+        1. Download all NIST feeds concurrently over the shared HTTP client
+           (conditional GET: unchanged feeds are skipped)
+        2. Loop through each CVE item and parse it into a row
+        3. Insert all rows with INSERT ... ON CONFLICT (cve_id) DO NOTHING
+        4. Existing CVEs are skipped by Postgres using the unique index
 
         Args:
             db (Session): Database session
             last_cve_id (str): Last CVE ID in database (for logging/reference)
 
         Returns:
-            list: List of NEW CVE objects that were added
+            list: List of NEW CVE IDs that were added
         """
-        # NIST recent CVEs JSON feed (contains last ~8 days of CVEs)
-        url = "https://nvd.nist.gov/feeds/json/cve/1.1/nvdcve-1.1-recent.json"
-
-        cves = []  # Track new CVEs added
+        cves = []  # Track new CVE IDs added
+        rows = []  # Parsed feed entries to insert
+        seen = set()  # CVE IDs already parsed (the feeds overlap)
 
         try:
-            logger.info(f"Fetching recent CVEs from NIST: {url}")
-
-            # Fetch the JSON feed
-            response = httpx.get(url, timeout=60)
-            response.raise_for_status()
-
-            data = response.json()
-            cve_items = data.get("CVE_Items", [])
-
-            logger.info(f"NIST feed contains {len(cve_items)} CVE items")
-
-            # Loop through each CVE in the feed
+            # Validators are read here: the session must not be shared with
+            # the download threads
+            feed_cache = self._load_feed_cache(db)
+            cached_headers = [
+                {
+                    "etag": feed_cache[url].etag,
+                    "last_modified": feed_cache[url].last_modified,
+                    "body_sha256": feed_cache[url].body_sha256
+                } if url in feed_cache else {}
+                for url in NVD_FEED_URLS
+            ]
+
+            # Downloads are I/O-bound: run them side by side so a run takes
+            # as long as the slowest feed rather than the sum of all feeds
+            with ThreadPoolExecutor(max_workers=len(NVD_FEED_URLS)) as pool:
+                feeds = list(pool.map(self._download_feed, NVD_FEED_URLS, cached_headers))
+
+            # Store new validators; committed together with the inserted CVEs
+            for url, (_, validators) in zip(NVD_FEED_URLS, feeds):
+                if validators is None:
+                    continue
+                cache_row = feed_cache.get(url)
+                if cache_row is None:
+                    cache_row = FeedCache(url=url)
+                    db.add(cache_row)
+                cache_row.etag = validators["etag"]
+                cache_row.last_modified = validators["last_modified"]
+                cache_row.body_sha256 = validators["body_sha256"]
+                cache_row.fetched_at = datetime.utcnow()
+
+            cve_items = [item for items, _ in feeds for item in items]
+
+            # Loop through each CVE in the feeds
             for item in cve_items:
                 cve_data = item.get("cve", {})
                 cve_id = cve_data.get("CVE_data_meta", {}).get("ID", "")
 
-                if not cve_id:
-                    continue  # Skip if no CVE ID
-
-                # CHECK IF CVE ALREADY EXISTS IN DATABASE
-                existing_cve = db.query(CVE).filter(CVE.cve_id == cve_id).first()
-                if existing_cve:
-                    # Already have this CVE - skip it
-                    logger.debug(f"Skipping existing CVE: {cve_id}")
-                    continue
-
-                # NEW CVE - parse and insert
-                logger.info(f"Found NEW CVE: {cve_id}")
+                if not cve_id or cve_id in seen:
+                    continue  # Skip if no CVE ID or already in another feed
+                seen.add(cve_id)
 
                 # Extract description (English)
                 descriptions = cve_data.get("description", {}).get("description_data", [])
@@ -199,28 +296,26 @@ class CVECollectorAgent:
                 cvss_v3 = impact.get("baseMetricV3", {})
                 cvss_v2 = impact.get("baseMetricV2", {})
 
-                cvss_score = "N/A"
+                cvss_score = None
                 severity = "UNKNOWN"
 
                 # Prefer CVSS v3
                 if cvss_v3:
                     cvss_data = cvss_v3.get("cvssV3", {})
-                    cvss_score = str(cvss_data.get("baseScore", "N/A"))
+                    cvss_score = cvss_data.get("baseScore")
                     severity = cvss_data.get("baseSeverity", "UNKNOWN").upper()
                 elif cvss_v2:
                     cvss_data = cvss_v2.get("cvssV2", {})
-                    cvss_score = str(cvss_data.get("baseScore", "N/A"))
+                    cvss_score = cvss_data.get("baseScore")
                     # Map CVSS v2 score to severity
-                    try:
-                        score = float(cvss_score)
-                        if score >= 7.0:
-                            severity = "HIGH"
-                        elif score >= 4.0:
-                            severity = "MEDIUM"
-                        else:
-                            severity = "LOW"
-                    except ValueError:
+                    if cvss_score is None:
                         severity = "UNKNOWN"
+                    elif cvss_score >= 7.0:
+                        severity = "HIGH"
+                    elif cvss_score >= 4.0:
+                        severity = "MEDIUM"
+                    else:
+                        severity = "LOW"
 
                 # Extract references
                 references = []
@@ -250,43 +345,48 @@ class CVECollectorAgent:
                 # Published date
                 published = item.get("publishedDate", "")
                 try:
-                    published_date = datetime.fromisoformat(published.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    published_date = parse_datetime(published)
+                except (ValueError, TypeError):
                     published_date = datetime.utcnow()
 
                 # Last modified date
                 last_modified = item.get("lastModifiedDate", "")
                 try:
-                    last_modified_date = datetime.fromisoformat(last_modified.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    last_modified_date = parse_datetime(last_modified)
+                except (ValueError, TypeError):
                     last_modified_date = datetime.utcnow()
 
-                # Create CVE object
-                cve = CVE(
-                    cve_id=cve_id,
-                    title=cve_id,  # Use CVE ID as title (NIST doesn't provide separate title)
-                    description=description,
-                    severity=severity,
-                    cvss_score=cvss_score,
-                    published_date=published_date,
-                    last_modified=last_modified_date,
-                    source="NIST",
-                    affected_products=affected_products,
-                    references=references,
-                    status="published"
-                )
-
-                # Add to database session
-                db.add(cve)
-                cves.append(cve)
+                # Build CVE row
+                rows.append({
+                    "cve_id": cve_id,
+                    "title": cve_id,  # Use CVE ID as title (NIST doesn't provide separate title)
+                    "description": description,
+                    "severity": severity,
+                    "cvss_score": cvss_score,
+                    "published_date": published_date,
+                    "last_modified": last_modified_date,
+                    "source": "NIST",
+                    "affected_products": affected_products,
+                    "references": references,
+                    "status": "published"
+                })
+
+            # Insert new CVEs; existing ones are skipped by the unique index
+            if rows:
+                cves = list(db.connection().execute(_INSERT_CVE, rows).scalars())
 
             # Commit all new CVEs to database
             db.commit()
 
-            logger.info(f"Successfully added {len(cves)} NEW CVEs to database")
+            for cve_id in cves:
+                logger.info(f"Found NEW CVE: {cve_id}")
+            logger.info(
+                f"Successfully added {len(cves)} NEW CVEs to database "
+                f"({len(rows) - len(cves)} already existed)"
+            )
 
         except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch NIST feed: {str(e)}")
+            logger.error(f"Failed to fetch NIST feeds: {str(e)}")
             raise
         except Exception as e:
             logger.error(f"Failed to process CVEs: {str(e)}")
@@ -13,7 +13,7 @@ from agno.agent import Agent
 # Agent:  Base class from Agno framework that handles tool calling, memory, and LLM interactions
 # An Agent is an autonomous entity that can use tools (like WebsiteTools) to accomplish tasks
 
-from agno.models. ollama import Ollama
+from Agents.OllamaModel import get_ollama_model
 # OpenAIChat: LLM model wrapper for OpenAI's API (gpt-4-turbo, gpt-4, etc.)
 # Other options: anthropic. Claude, replicate models, etc.
 # The model is what "thinks" and decides which tools to use and how to respond
@@ -74,11 +74,7 @@ class DarknetNewsAgent:
             name="darknet-agent",
 
             # CHANGED: Use Ollama model
-            model=Ollama(
-                id=model_name,
-                host="http://192.168.1.155:11434",
-                timeout=120
-            ),
+            model=get_ollama_model(model_name),
 
             tools=[WebsiteTools()],
 
@@ -0,0 +1,53 @@
+"""
+Shared Ollama model handles for the Agno agents.
+
+Agents that use the same Ollama server share one client (and its HTTP
+keep-alive pool) instead of each opening their own.
+"""
+
+import atexit
+from functools import lru_cache
+
+import httpx
+from agno.models.ollama import Ollama
+from ollama import Client
+
+# Ollama server used by all agents
+OLLAMA_HOST = "http://192.168.1.155:11434"
+
+
+@lru_cache(maxsize=None)
+def get_ollama_client(host: str = OLLAMA_HOST, timeout: int = 120) -> Client:
+    """
+    Get the shared Ollama client for a server.
+
+    Args:
+        host (str): Ollama server URL
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        Client: Client whose connection pool is reused by every model handle
+    """
+    client = Client(
+        host=host,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    )
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=8)
+def get_ollama_model(model_name: str, host: str = OLLAMA_HOST, timeout: int = 120) -> Ollama:
+    """
+    Get the shared Ollama model handle for a model/server pair.
+
+    Args:
+        model_name (str): Ollama model name (e.g. "llama3.2:3b")
+        host (str): Ollama server URL
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        Ollama: Model handle, created on first use
+    """
+    return Ollama(id=model_name, host=host, timeout=timeout, client=get_ollama_client(host, timeout))
@@ -12,14 +12,14 @@ This agent:
 """
 
 import logging
-import re
 from datetime import datetime
 from typing import List, Dict, Optional
 from Database import CVE, POC, AgentRun
 from sqlalchemy. orm import Session
 from sqlalchemy import desc
 from agno.agent import Agent
-from agno.models. ollama import Ollama
+from Agents.OllamaModel import get_ollama_model
+from app.Patterns import JSON_ARRAY_RE
 from agno.tools.website import WebsiteTools
 from ddgs import DDGS  # DuckDuckGo search library
 import time
@@ -50,11 +50,7 @@ class POCHunterAgent:
         # Initialize Ollama-based Agno Agent for analysis
         self.agent = Agent(
             name="poc-hunter",
-            model=Ollama(
-                model_id=model_name,
-                base_url="http://192.168.1.155:11434",
-                timeout=120
-            ),
+            model=get_ollama_model(model_name),
             tools=[WebsiteTools()],
             instructions="""
             You are an expert Proof of Concept (POC) and exploit researcher.
@@ -412,7 +408,7 @@ ONLY return valid JSON, no other text.
             import json
 
             # Extract JSON from response
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            json_match = JSON_ARRAY_RE.search(response)
             if json_match:
                 analysis = json.loads(json_match.group())
 
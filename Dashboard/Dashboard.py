@@ -286,7 +286,7 @@ def update_cve_table(search, severity, next_clicks, prev_clicks, page):
                 "textAlign": "center",
                 "fontWeight": "bold"
             }),
-            html.Td(cve["cvss_score"] or "N/A", style={"textAlign": "center"}),
+            html.Td(cve["cvss_score"] if cve["cvss_score"] is not None else "N/A", style={"textAlign": "center"}),
             html.Td(cve["published_date"][:10], style={"color": "#666"})
         ])
         for cve in cves
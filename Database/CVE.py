@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, Index
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, Index, Numeric
+from sqlalchemy.dialects.postgresql import JSONB
 from Database.base import Base  # Import shared Base
 import uuid
 from datetime import datetime
@@ -13,12 +14,12 @@ class CVE(Base):
     title = Column(String(255))
     description = Column(Text)
     severity = Column(String(20), index=True)
-    cvss_score = Column(String(10))
+    cvss_score = Column(Numeric(3, 1), nullable=True, index=True)  # Range queries use the index
     published_date = Column(DateTime, index=True)
     last_modified = Column(DateTime)
     source = Column(String(100), default="NIST")
-    affected_products = Column(JSON, default=list)
-    references = Column(JSON, default=list)
+    affected_products = Column(JSONB, default=list)
+    references = Column(JSONB, default=list)
     status = Column(String(50), default="published", index=True)
     cve_metadata = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -28,4 +29,9 @@ class CVE(Base):
         Index('idx_cve_published', 'published_date'),
         Index('idx_cve_severity', 'severity'),
         Index('idx_cve_source', 'source'),
+        # "Latest CVEs from <source>" without a sort step
+        Index('idx_cve_source_pub', source, published_date.desc()),
+        # Containment lookups (@>) by CPE / reference URL
+        Index('idx_cve_affected_gin', affected_products, postgresql_using='gin'),
+        Index('idx_cve_references_gin', references, postgresql_using='gin'),
     )
@@ -89,10 +89,30 @@ class DatabaseConfig(BaseModel):
         le=100,
         description="Max overflow connections beyond pool_size"
     )
+    pool_timeout: int = Field(
+        default=30,
+        ge=1,
+        le=300,
+        description="Seconds to wait for a free pooled connection before failing"
+    )
+    pool_recycle: int = Field(
+        default=300,
+        ge=30,
+        le=3600,
+        description="Replace pooled connections older than this many seconds"
+    )
+    pool_pre_ping: bool = Field(
+        default=False,
+        description="Probe each connection on checkout (enable if the server drops idle connections quickly)"
+    )
     echo: bool = Field(
         default=False,
         description="Log all SQL queries (security risk in production! )"
     )
+    echo_pool: bool = Field(
+        default=False,
+        description="Log connection pool checkouts/checkins (development only)"
+    )
 
     @validator('url')
     def validate_database_url(cls, v):
@@ -263,7 +283,11 @@ def load_config() -> AppConfig:
                 ),
                 pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
                 max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
-                echo=os.getenv("DB_ECHO", "false").lower() == "true"
+                pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+                pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "300")),
+                pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+                echo=os.getenv("DB_ECHO", "false").lower() == "true",
+                echo_pool=os.getenv("DB_ECHO_POOL", "false").lower() == "true"
             ),
             ollama=OllamaConfig(
                 base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
@@ -10,6 +10,9 @@ PREVENTS:  SQL injection (via parameterization), connection leaks, cascading fai
 
 import logging
 import threading
+import time
+import weakref
+from collections import deque
 from contextlib import contextmanager
 from typing import Generator, Optional
 from datetime import datetime, timedelta
@@ -18,39 +21,82 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool, QueuePool
 from Database.DatabaseConfig import get_config
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 logger = logging.getLogger(__name__)
 
 
 # ==================== CONNECTION TRACKING ====================
 
+class _ConnectionEntry:
+    """Session tracked for one thread (weak-referenceable for the leak registry)"""
+    __slots__ = ("session", "thread_id", "created_at", "closed", "__weakref__")
+
+    def __init__(self, session: Session, thread_id: int, created_at: float):
+        self.session = weakref.ref(session)  # Tracking must not keep the session alive
+        self.thread_id = thread_id  # Thread that opened the session
+        self.created_at = created_at  # time.monotonic() at registration
+        self.closed = False  # Set by unregister_connection()
+
+
 class ConnectionTracker:
     """
     Track active database connections to detect leaks.
 
     If connections aren't closed properly, this will warn you.
+
+    Each thread keeps its own entry in thread-local storage, so registering
+    never takes a lock. The leak check reads a weak registry of those entries.
+    Callers unregister the entry returned by register_connection() once the
+    session is closed (possibly from another thread than the one that opened
+    it). Sessions handed out without guaranteed cleanup can ask for a
+    weakref.finalize callback that untracks them when garbage collected.
     """
 
     def __init__(self):
-        self.active_connections = {}  # Map of thread_id -> (session, timestamp)
-        self.lock = threading.Lock()
+        self._tls = threading.local()  # .entry -> this thread's _ConnectionEntry
+        self._registry = weakref.WeakValueDictionary()  # thread_id -> _ConnectionEntry
+        self.lock = threading.Lock()  # Serializes leak sweeps only
 
-    def register_connection(self, session: Session):
-        """Register a new database connection"""
-        thread_id = threading.get_ident()
-        with self.lock:
-            if thread_id in self.active_connections:
-                logger.warning(
-                    f"⚠️  Thread {thread_id} already has an active connection.  "
-                    "This may cause issues."
-                )
-            self.active_connections[thread_id] = (session, datetime.utcnow())
-
-    def unregister_connection(self, session: Session):
-        """Unregister a closed database connection"""
+    def register_connection(self, session: Session, untrack_on_gc: bool = False) -> _ConnectionEntry:
+        """
+        Register a new database connection.
+
+        Args:
+            session (Session): Session to track
+            untrack_on_gc (bool): Also untrack it when garbage collected
+                (for sessions the caller may never unregister)
+
+        Returns:
+            _ConnectionEntry: Entry to pass to unregister_connection()
+        """
         thread_id = threading.get_ident()
-        with self.lock:
-            if thread_id in self.active_connections:
-                del self.active_connections[thread_id]
+        previous = getattr(self._tls, "entry", None)
+        if previous is not None and not previous.closed and previous.session() is not None:
+            logger.warning(
+                f"⚠️  Thread {thread_id} already has an active connection.  "
+                "This may cause issues."
+            )
+        entry = _ConnectionEntry(session, thread_id, time.monotonic())
+        self._tls.entry = entry
+        self._registry[thread_id] = entry
+        if untrack_on_gc:
+            weakref.finalize(session, self._on_session_gc, thread_id, entry)
+        return entry
+
+    def _on_session_gc(self, thread_id: int, entry: _ConnectionEntry):
+        """Untrack a session once it has been garbage collected (may run on any thread)"""
+        if self._registry.get(thread_id) is entry:
+            self._registry.pop(thread_id, None)
+
+    def unregister_connection(self, entry: _ConnectionEntry):
+        """Unregister a closed database connection (entry from register_connection())"""
+        # Marking the entry is safe from any thread; the registry slot is
+        # only dropped if it still belongs to this session
+        entry.closed = True
+        if getattr(self._tls, "entry", None) is entry:
+            self._tls.entry = None
+        if self._registry.get(entry.thread_id) is entry:
+            self._registry.pop(entry.thread_id, None)
 
     def check_for_leaks(self, max_age_seconds: int = 300):
         """
@@ -60,15 +106,25 @@ class ConnectionTracker:
             max_age_seconds (int): Warn if connection open longer than this
         """
         with self.lock:
-            now = datetime.utcnow()
-            for thread_id, (session, created_at) in self.active_connections.items():
-                age = (now - created_at).total_seconds()
-                if age > max_age_seconds:
+            # Other threads register without the lock: retry if the snapshot races them
+            while True:
+                try:
+                    entries = list(self._registry.items())
+                    break
+                except RuntimeError:
+                    continue
+
+            now = time.monotonic()
+            for thread_id, entry in entries:
+                age = now - entry.created_at
+                if age > max_age_seconds and not entry.closed and entry.session() is not None:
+                    # Wall-clock time only for the message
+                    created = datetime.utcnow() - timedelta(seconds=age)
                     logger.warning(
                         f"⚠️  POTENTIAL CONNECTION LEAK:\n"
                         f"    Thread ID: {thread_id}\n"
                         f"    Age: {age:.0f} seconds\n"
-                        f"    Created: {created_at}\n"
+                        f"    Created: {created}\n"
                         f"    Please ensure db.close() or context managers are used!"
                     )
 
@@ -77,6 +133,7 @@ class ConnectionTracker:
 
 _engine = None
 _SessionLocal = None
+_idle_sessions = deque()  # Closed sessions ready for reuse (set up by init_db)
 _connection_tracker = ConnectionTracker()
 
 
@@ -87,7 +144,7 @@ def init_db():
     Called once at application startup.
     Uses connection pooling to reuse connections efficiently.
     """
-    global _engine, _SessionLocal
+    global _engine, _SessionLocal, _idle_sessions
 
     config = get_config()
     logger.info("Initializing database connection pool...")
@@ -99,9 +156,14 @@ def init_db():
             poolclass=QueuePool,  # Use connection pool (not NullPool!)
             pool_size=config.database.pool_size,  # Min 5, default 10
             max_overflow=config.database.max_overflow,  # Additional connections
-            pool_pre_ping=True,  # Test connections before using (detect stale connections)
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_timeout=config.database.pool_timeout,  # Fail instead of waiting forever for a connection
+            pool_use_lifo=True,  # Reuse the most recent connection; idle extras can time out
+            # Stale connections are recycled proactively instead of probed with
+            # an extra SELECT 1 on every checkout; probing stays available via config
+            pool_pre_ping=config.database.pool_pre_ping,
+            pool_recycle=config.database.pool_recycle,
             echo=config.database.echo,  # Log SQL if enabled (SECURITY RISK!)
+            echo_pool=config.database.echo_pool,  # Log pool checkouts (dev only)
             connect_args={
                 "connect_timeout": 10,  # Don't hang forever
                 "application_name": "cve_intelligence",
@@ -112,12 +174,13 @@ def init_db():
         @event.listens_for(_engine, "connect")
         def on_connect(dbapi_conn, connection_record):
             """Called when a connection is created"""
-            logger.debug(f"✓ Database connection opened (pool size: {_engine.pool.size()})")
+            if logger.isEnabledFor(logging.DEBUG):  # pool.size() only when it will be logged
+                logger.debug("✓ Database connection opened (pool size: %d)", _engine.pool.size())
 
         @event.listens_for(_engine, "close")
         def on_close(dbapi_conn, connection_record):
             """Called when a connection is closed"""
-            logger.debug(f"✓ Database connection closed")
+            logger.debug("✓ Database connection closed")
 
         # Create session factory
         _SessionLocal = sessionmaker(
@@ -127,6 +190,30 @@ def init_db():
             autocommit=False,  # Explicit transaction control
         )
 
+        # Remember whether a session wrote anything, so get_db() can skip the
+        # COMMIT for read-only sessions without losing Core DML
+        # (db.execute(insert(...))) or changes that were already flushed
+        @event.listens_for(_SessionLocal, "after_flush")
+        def on_flush(session, flush_context):
+            session.info["wrote"] = True
+
+        @event.listens_for(_SessionLocal, "do_orm_execute")
+        def on_execute(orm_execute_state):
+            statement = orm_execute_state.statement
+            if orm_execute_state.is_select:
+                return
+            if isinstance(statement, TextClause) and statement.text.lstrip()[:6].upper() == "SELECT":
+                return
+            orm_execute_state.session.info["wrote"] = True
+
+        @event.listens_for(_SessionLocal, "after_commit")
+        @event.listens_for(_SessionLocal, "after_rollback")
+        def on_transaction_end(session):
+            session.info.pop("wrote", None)
+
+        # Closed sessions kept for reuse by get_db(), at most one per pooled connection
+        _idle_sessions = deque(maxlen=config.database.pool_size + config.database.max_overflow)
+
         # Test connection
         with _SessionLocal() as db:
             db.execute(text("SELECT 1"))
@@ -143,12 +230,15 @@ def get_db() -> Generator[Session, None, None]:
     """
     Get a database session with automatic cleanup.
 
-    IMPORTANT: Use this in a context manager (with statement)!
+    This is a generator for FastAPI's Depends(); outside of FastAPI use
+    db_session() in a with statement, which runs the same cleanup.
+    Don't keep the session after the cleanup runs: it is closed and handed
+    out again by a later get_db() call.
 
     Usage:
-        with get_db() as db:
-            result = db.query(CVE).first()
-            # db automatically closed and cleaned up
+        @app.get("/cves")
+        def list_cves(db: Session = Depends(get_db)):
+            ...
 
     Raises:
         RuntimeError: If get_db() called before init_db()
@@ -158,20 +248,31 @@ def get_db() -> Generator[Session, None, None]:
             "Database not initialized!  Call init_db() first."
         )
 
-    # Create new session
-    db = _SessionLocal()
+    # Reuse a closed session if one is idle instead of building a new one.
+    # A session belongs to this call, not to a thread: FastAPI may run a
+    # dependency's setup and cleanup on different threadpool threads.
+    try:
+        db = _idle_sessions.pop()
+    except IndexError:
+        db = _SessionLocal()
     thread_id = threading.get_ident()
 
+    # Track this connection
+    entry = _connection_tracker.register_connection(db)
+
     try:
-        # Track this connection
-        _connection_tracker.register_connection(db)
-        logger.debug(f"[Thread {thread_id}] Database session opened")
+        logger.debug("[Thread %d] Database session opened", thread_id)
 
         yield db
 
-        # Commit any pending changes
-        db.commit()
-        logger.debug(f"[Thread {thread_id}] Database session committed")
+        # Commit if the session has pending changes or wrote anything since
+        # its last commit; read-only sessions skip the COMMIT round-trip
+        # (close() below ends their transaction). Statements sent on
+        # db.connection() directly bypass the session, so callers doing that
+        # commit themselves.
+        if db.new or db.dirty or db.deleted or db.info.get("wrote"):
+            db.commit()
+            logger.debug("[Thread %d] Database session committed", thread_id)
 
     except Exception as e:
         # Rollback on error
@@ -180,10 +281,50 @@ def get_db() -> Generator[Session, None, None]:
         raise
 
     finally:
-        # ALWAYS close, even if exception occurred
+        # ALWAYS close, even if exception occurred: returns the connection
+        # to the pool and leaves the session empty and ready for reuse
         db.close()
-        _connection_tracker.unregister_connection(db)
-        logger.debug(f"[Thread {thread_id}] Database session closed")
+        _connection_tracker.unregister_connection(entry)
+        db.info.clear()
+        _idle_sessions.append(db)
+        logger.debug("[Thread %d] Database session closed", thread_id)
+
+
+# Context manager form of get_db() for code outside FastAPI:
+#     with db_session() as db:
+#         result = db.query(CVE).first()
+#         # committed (or rolled back), closed and untracked on exit
+db_session = contextmanager(get_db)
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Get a read-only database session on an AUTOCOMMIT connection.
+
+    Each statement commits on its own, so there is no BEGIN/COMMIT
+    bookkeeping per request. Changes made through this session are never
+    committed as a unit; use get_db() for anything that writes.
+
+    Usage:
+        @app.get("/cves")
+        def list_cves(db: Session = Depends(get_read_db)):
+            ...
+
+    Raises:
+        RuntimeError: If get_read_db() called before init_db()
+    """
+    if _SessionLocal is None:
+        raise RuntimeError(
+            "Database not initialized!  Call init_db() first."
+        )
+
+    with _engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        db = _SessionLocal(bind=connection)
+        try:
+            yield db
+        finally:
+            db.close()
 
 
 def get_db_no_context() -> Session:
@@ -191,7 +332,7 @@ def get_db_no_context() -> Session:
     Get a database session WITHOUT automatic cleanup.
 
     WARNING: You must call db.close() manually!
-    Prefer get_db() with context manager instead.
+    Prefer db_session() (or get_db() via FastAPI Depends) instead.
 
     Only use this if context manager isn't possible.
     """
@@ -199,7 +340,8 @@ def get_db_no_context() -> Session:
         raise RuntimeError("Database not initialized! Call init_db() first.")
 
     db = _SessionLocal()
-    _connection_tracker.register_connection(db)
+    # The caller may never close it, so let GC untrack it as well
+    _connection_tracker.register_connection(db, untrack_on_gc=True)
     return db
 
 
@@ -230,6 +372,6 @@ def get_connection_pool_status() -> dict:
     return {
         "pool_size": pool.size(),
         "checked_out": pool.checkedout(),
-        "overflow": getattr(pool, "overflow", "N/A"),
-        "queue_size": getattr(pool, "queue", "N/A"),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
     }
\ No newline at end of file
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime
+
+from Database import Base
+
+
+class FeedCache(Base):
+    """HTTP cache validators for remote feeds (conditional GET)"""
+    __tablename__ = "feed_cache"
+
+    url = Column(String(500), primary_key=True)
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(64), nullable=True)  # Raw Last-Modified header value
+    body_sha256 = Column(String(64), nullable=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
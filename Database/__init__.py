@@ -8,6 +8,7 @@ from Database.CVE import CVE
 from Database.HackingNews import HackingNews
 from Database.AgentRun import AgentRun
 from Database.AnalysisResult import AnalysisResult
+from Database.FeedCache import FeedCache
 
 __all__ = [
     'Base',
@@ -17,5 +18,6 @@ __all__ = [
     'CVE',
     'HackingNews',
     'AgentRun',
-    'AnalysisResult'
+    'AnalysisResult',
+    'FeedCache'
 ]
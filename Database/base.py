@@ -19,7 +19,10 @@ engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True to see SQL queries
     pool_size=10,
-    max_overflow=20
+    max_overflow=20,
+    # Send executemany() INSERTs as multi-row VALUES pages (bulk imports)
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000
 )
 
 # Shared Base for all models
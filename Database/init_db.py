@@ -45,7 +45,8 @@ def check_tables_exist() -> dict:
         'cves',
         'hacking_news',
         'agent_runs',
-        'analysis_results'
+        'analysis_results',
+        'feed_cache'
     ]
 
     status = {}
@@ -6,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, or_
 from Database import  CVE, HackingNews, AgentRun
-from Database.DatabaseManager import init_db, get_db
+from Database.DatabaseManager import init_db, get_read_db
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -42,7 +42,7 @@ class CVEResponse(BaseModel):
     title: str
     description: Optional[str]
     severity: str
-    cvss_score: Optional[str]
+    cvss_score: Optional[float]
     published_date: datetime
     source: str
     affected_products: list
@@ -98,7 +98,7 @@ class POCResponse(BaseModel):
 
 
 @app.get("/api/pocs/{cve_id}", response_model=List[POCResponse])
-async def get_pocs_for_cve(cve_id: str, db: Session = Depends(get_db)):
+async def get_pocs_for_cve(cve_id: str, db: Session = Depends(get_read_db)):
     """Get all POCs for a specific CVE"""
     pocs = db.query(POC).filter(POC.cve_id == cve_id).order_by(desc(POC.stars)).all()
     return pocs
@@ -110,7 +110,7 @@ async def get_all_pocs(
         limit: int = Query(50, ge=1, le=500),
         source: Optional[str] = None,
         found: Optional[bool] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_read_db)
 ):
     """Get POCs with optional filtering"""
     query = db.query(POC)
@@ -126,7 +126,7 @@ async def get_all_pocs(
 
 
 @app.get("/api/pocs/stats/summary")
-async def get_poc_stats(db: Session = Depends(get_db)):
+async def get_poc_stats(db: Session = Depends(get_read_db)):
     """Get POC statistics"""
     total_pocs = db.query(POC).count()
     cves_with_pocs = db.query(POC.cve_id).distinct().count()
@@ -154,7 +154,7 @@ async def get_cves(
         limit: int = Query(50, ge=1, le=500),
         severity: Optional[str] = None,
         search: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_read_db)
 ):
     """Get CVEs with optional filtering and search"""
     query = db.query(CVE)
@@ -176,7 +176,7 @@ async def get_cves(
 
 
 @app.get("/api/cves/{cve_id}", response_model=CVEResponse)
-async def get_cve(cve_id: str, db: Session = Depends(get_db)):
+async def get_cve(cve_id: str, db: Session = Depends(get_read_db)):
     """Get a specific CVE"""
     cve = db.query(CVE).filter(CVE.cve_id == cve_id).first()
     if not cve:
@@ -185,7 +185,7 @@ async def get_cve(cve_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/api/cves/stats/summary")
-async def get_cve_stats(db: Session = Depends(get_db)):
+async def get_cve_stats(db: Session = Depends(get_read_db)):
     """Get CVE statistics"""
     severities = {}
     for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW"]:
@@ -213,7 +213,7 @@ async def get_news(
         category: Optional[str] = None,
         source: Optional[str] = None,
         is_darknet: Optional[bool] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_read_db)
 ):
     """Get hacking news with filters"""
     query = db.query(HackingNews)
@@ -232,7 +232,7 @@ async def get_news(
 
 
 @app.get("/api/news/stats/summary")
-async def get_news_stats(db: Session = Depends(get_db)):
+async def get_news_stats(db: Session = Depends(get_read_db)):
     """Get news statistics"""
     total = db.query(HackingNews).count()
     darknet = db.query(HackingNews).filter(HackingNews.is_darknet == True).count()
@@ -256,7 +256,7 @@ async def get_news_stats(db: Session = Depends(get_db)):
 async def get_agent_runs(
         agent_name: Optional[str] = None,
         limit: int = Query(20, ge=1, le=100),
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_read_db)
 ):
     """Get agent execution history"""
     query = db.query(AgentRun)
@@ -269,7 +269,7 @@ async def get_agent_runs(
 
 
 @app.get("/api/agents/status")
-async def get_agent_status(db: Session = Depends(get_db)):
+async def get_agent_status(db: Session = Depends(get_read_db)):
     """Get current agent status"""
     agents = ["cve_agent", "news_agent", "darknet_agent"]
     status = {}
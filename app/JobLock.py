@@ -6,10 +6,13 @@ PREVENTS: Duplicate agent runs, race conditions, database conflicts
 
 import logging
 import threading
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
+# Number of independently locked job shards (power of two)
+_SHARD_COUNT = 8
+
 
 # ==================== IN-MEMORY JOB LOCKS ====================
 
@@ -21,8 +24,14 @@ class JobLockManager:
     """
 
     def __init__(self):
-        self.active_jobs = {}  # job_name -> (lock, started_at)
-        self.lock = threading.Lock()
+        # Job state is split into independent shards, each with its own lock,
+        # so unrelated jobs never wait on each other.
+        # Each shard: (lock, {job_name -> (lock, started_at as time.monotonic())})
+        self._shards = [(threading.Lock(), {}) for _ in range(_SHARD_COUNT)]
+
+    def _shard(self, job_name: str) -> tuple:
+        """Get the (lock, jobs) shard that owns a job name"""
+        return self._shards[hash(job_name) & (_SHARD_COUNT - 1)]
 
     def acquire_lock(self, job_name: str, timeout_seconds: int = 600) -> bool:
         """
@@ -35,11 +44,12 @@ class JobLockManager:
         Returns:
             bool: True if lock acquired, False if job already running
         """
-        with self.lock:
+        shard_lock, active_jobs = self._shard(job_name)
+        with shard_lock:
             # Check if job is already running
-            if job_name in self.active_jobs:
-                job_lock, started_at = self.active_jobs[job_name]
-                elapsed = (datetime.utcnow() - started_at).total_seconds()
+            if job_name in active_jobs:
+                job_lock, started_at = active_jobs[job_name]
+                elapsed = time.monotonic() - started_at
 
                 if elapsed > timeout_seconds:
                     logger.warning(
@@ -47,7 +57,7 @@ class JobLockManager:
                         f"Assuming it crashed.  Acquiring new lock."
                     )
                     # Force unlock (job probably crashed)
-                    del self.active_jobs[job_name]
+                    del active_jobs[job_name]
                 else:
                     logger.warning(
                         f"⚠️  Job '{job_name}' is already running (started {elapsed:.0f}s ago). "
@@ -57,33 +67,39 @@ class JobLockManager:
 
             # Acquire lock
             job_lock = threading.Lock()
-            self.active_jobs[job_name] = (job_lock, datetime.utcnow())
+            active_jobs[job_name] = (job_lock, time.monotonic())
             logger.info(f"✓ Lock acquired for job: {job_name}")
 
             return True
 
     def release_lock(self, job_name: str):
         """Release a job lock"""
-        with self.lock:
-            if job_name in self.active_jobs:
-                del self.active_jobs[job_name]
+        shard_lock, active_jobs = self._shard(job_name)
+        with shard_lock:
+            if job_name in active_jobs:
+                del active_jobs[job_name]
                 logger.info(f"✓ Lock released for job: {job_name}")
 
     def is_running(self, job_name: str) -> bool:
         """Check if a job is currently running"""
-        with self.lock:
-            return job_name in self.active_jobs
+        shard_lock, active_jobs = self._shard(job_name)
+        with shard_lock:
+            return job_name in active_jobs
 
     def get_running_jobs(self) -> list:
         """Get list of all currently running jobs"""
-        with self.lock:
-            return [
-                {
-                    "name": name,
-                    "elapsed_seconds": (datetime.utcnow() - started_at).total_seconds()
-                }
-                for name, (_, started_at) in self.active_jobs.items()
-            ]
+        running = []
+        for shard_lock, active_jobs in self._shards:
+            with shard_lock:
+                now = time.monotonic()
+                running.extend(
+                    {
+                        "name": name,
+                        "elapsed_seconds": now - started_at
+                    }
+                    for name, (_, started_at) in active_jobs.items()
+                )
+        return running
 
 
 # Global lock manager
@@ -0,0 +1,14 @@
+"""
+Regular expressions shared across the project.
+
+Each pattern is compiled once here and imported where it is needed, so
+every module matches against the same compiled object.
+"""
+
+import re
+
+# Dangerous URL schemes, any case
+BAD_URL_RE = re.compile(r'(?i)(?:javascript:|data:)')
+
+# First JSON array in an LLM response
+JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
@@ -12,7 +12,8 @@ PREVENTS: NVD API bans, GitHub API throttling, DuckDuckGo blocks
 import logging
 import threading
 import time
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from Database.DatabaseConfig import RATE_LIMITS
 
@@ -30,6 +31,12 @@ class RateLimiter:
     - Each request costs 1 token
     - Tokens refill at:  rate_per_minute / 60 tokens per second
     - If no tokens, request waits or is rejected
+
+    The bucket is tracked as a single "theoretical arrival time" (GCRA).
+    Callers check it under a Condition and, if no token is free, wait on the
+    Condition (which releases the lock) until the next token is due, so
+    waiting callers don't block each other. update_rate() wakes all waiters
+    so they re-check against the new rate instead of sleeping it out.
     """
 
     def __init__(self, requests_per_minute: int):
@@ -39,11 +46,27 @@ class RateLimiter:
         Args:
             requests_per_minute (int): Max requests per 60 seconds
         """
+        self._cond = threading.Condition()  # Held only while checking/taking a token
+        self._tat = time.monotonic()  # Time at which the bucket is full again
+        self._set_rate(requests_per_minute)
+
+    def _set_rate(self, requests_per_minute: int):
+        """Derive the GCRA parameters for a rate (caller holds the condition)"""
         self.requests_per_minute = requests_per_minute
-        self.tokens = float(requests_per_minute)
         self.max_tokens = float(requests_per_minute)
-        self.last_refill = time.time()
-        self.lock = threading.Lock()
+        self._interval = 60.0 / requests_per_minute  # Seconds per token
+        self._burst = (self.max_tokens - 1) * self._interval  # How far ahead a full bucket reaches
+
+    def update_rate(self, requests_per_minute: int):
+        """
+        Change the rate limit (e.g. after a config reload).
+
+        Args:
+            requests_per_minute (int): New max requests per 60 seconds
+        """
+        with self._cond:
+            self._set_rate(requests_per_minute)
+            self._cond.notify_all()
 
     def wait_if_needed(self) -> float:
         """
@@ -52,59 +75,60 @@ class RateLimiter:
         Returns:
             float: How long we waited (seconds)
         """
-        with self.lock:
-            waited = self._wait_for_token()
-            self.tokens -= 1
-
-            elapsed = time.time() - self.last_refill
-            if elapsed >= 60:
-                # Refill tokens after 1 minute
-                self.tokens = self.max_tokens
-                self.last_refill = time.time()
-
-            return waited
-
-    def _wait_for_token(self) -> float:
-        """Internal method to wait for token availability"""
-        start_time = time.time()
-
-        # Refill tokens based on time elapsed
-        elapsed = time.time() - self.last_refill
-        refill_rate = self.max_tokens / 60  # Tokens per second
-        self.tokens = min(self.max_tokens, self.tokens + (elapsed * refill_rate))
-        self.last_refill = time.time()
-
-        # If no tokens, calculate wait time
-        if self.tokens < 1:
-            wait_time = (1 - self.tokens) / refill_rate
-            logger.info(
-                f"⏳ Rate limit reached.  Waiting {wait_time:.1f}s before next request..."
-            )
-            time.sleep(wait_time)
-            self.tokens = 0
-
-        waited = time.time() - start_time
-        return waited
+        # Fast path: with more than 2 tokens left, take one without the lock.
+        # The read-modify-write is relaxed (a rare race can leave a request
+        # uncharged), which the 2-token margin keeps harmless.
+        now = time.monotonic()
+        tat = self._tat
+        if tat + 2 * self._interval < now + self._burst:
+            self._tat = max(tat, now) + self._interval
+            return 0.0
+
+        start_time = None
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                tat = max(self._tat, now)
+                wait_time = tat - self._burst - now  # Until this request may go
+                if wait_time <= 0:
+                    self._tat = tat + self._interval
+                    break
+
+                if start_time is None:
+                    start_time = now
+                    logger.info(
+                        f"⏳ Rate limit reached.  Waiting {wait_time:.1f}s before next request..."
+                    )
+                # Releases the lock while waiting; re-check after waking
+                self._cond.wait(timeout=wait_time)
+
+        return 0.0 if start_time is None else now - start_time
 
     def get_stats(self) -> dict:
         """Get current rate limiter status"""
-        with self.lock:
-            return {
-                "tokens_available": self.tokens,
-                "max_tokens": self.max_tokens,
-                "requests_per_minute": self.requests_per_minute,
-            }
+        with self._cond:
+            tat = self._tat
+        tokens = (self._burst - max(tat - time.monotonic(), 0.0)) / self._interval + 1
+        return {
+            "tokens_available": max(tokens, 0.0),
+            "max_tokens": self.max_tokens,
+            "requests_per_minute": self.requests_per_minute,
+        }
 
 
 # ==================== GLOBAL RATE LIMITERS ====================
 
-_rate_limiters: Dict[str, RateLimiter] = {}
-_limiter_lock = threading.Lock()
+# RATE_LIMITS is static, so every limiter is created once at import and the
+# read-only mapping is then read without any locking
+_rate_limiters: Mapping[str, RateLimiter] = MappingProxyType({
+    name: RateLimiter(requests_per_minute=rate_limit["requests_per_minute"])
+    for name, rate_limit in RATE_LIMITS.items()
+})
 
 
 def get_rate_limiter(api_name: str) -> RateLimiter:
     """
-    Get or create a rate limiter for an API.
+    Get the rate limiter for an API.
 
     Args:
         api_name (str): Name of API (must be in RATE_LIMITS config)
@@ -112,24 +136,10 @@ def get_rate_limiter(api_name: str) -> RateLimiter:
     Returns:
         RateLimiter: Rate limiter for that API
     """
-    global _rate_limiters
-
-    if api_name not in RATE_LIMITS:
-        raise ValueError(f"Unknown API: {api_name}. Available: {list(RATE_LIMITS.keys())}")
-
-    if api_name not in _rate_limiters:
-        with _limiter_lock:
-            if api_name not in _rate_limiters:
-                rate_limit = RATE_LIMITS[api_name]
-                _rate_limiters[api_name] = RateLimiter(
-                    requests_per_minute=rate_limit["requests_per_minute"]
-                )
-                logger.info(
-                    f"✓ Rate limiter created for {api_name}:  "
-                    f"{rate_limit['requests_per_minute']} req/min"
-                )
-
-    return _rate_limiters[api_name]
+    try:
+        return _rate_limiters[api_name]
+    except KeyError:
+        raise ValueError(f"Unknown API: {api_name}. Available: {list(RATE_LIMITS.keys())}") from None
 
 
 def rate_limit(api_name: str):
@@ -142,14 +152,15 @@ def rate_limit(api_name: str):
             # This function will wait if rate limit exceeded
             ...
     """
+    # Resolved once when the decorator is applied (unknown names fail early)
+    limiter = get_rate_limiter(api_name)
 
     def decorator(func):
         def wrapper(*args, **kwargs):
-            limiter = get_rate_limiter(api_name)
             waited = limiter.wait_if_needed()
 
             if waited > 0:
-                logger.debug(f"Rate limiter wait: {waited:.2f}s for {api_name}")
+                logger.debug("Rate limiter wait: %.2fs for %s", waited, api_name)
 
             return func(*args, **kwargs)
 
@@ -12,6 +12,7 @@ PREVENTS:  Cascading failures, overwhelming failed services
 import logging
 import time
 import random
+import httpx
 from typing import Callable, TypeVar, Any, Optional
 from Database.DatabaseConfig import RETRY_CONFIG
 
@@ -19,6 +20,25 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+_rand = random.random
+
+# Errors retried by retry_on_network_errors
+_NETWORK_EXCEPTIONS = (httpx.HTTPError, TimeoutError, ConnectionError)
+
+
+def _backoff_schedule(max_retries: int, initial_backoff: float, max_backoff: float,
+                      backoff_multiplier: float) -> tuple:
+    """
+    Precompute the (un-jittered) wait before each retry.
+
+    Returns:
+        tuple: Backoff in seconds after failed attempt 1, 2, ... (index attempt - 1)
+    """
+    return tuple(
+        min(initial_backoff * (backoff_multiplier ** i), max_backoff)
+        for i in range(max_retries)
+    )
+
 
 # ==================== RETRY DECORATORS ====================
 
@@ -53,6 +73,9 @@ def retry_with_backoff(
     backoff_multiplier = backoff_multiplier or RETRY_CONFIG['backoff_multiplier']
     jitter = jitter if jitter is not None else RETRY_CONFIG['jitter']
 
+    # The schedule never changes between calls: compute it once per decoration
+    schedule = _backoff_schedule(max_retries, initial_backoff, max_backoff, backoff_multiplier)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
@@ -60,7 +83,7 @@ def retry_with_backoff(
             for attempt in range(1, max_retries + 1):
                 try:
                     if attempt > 1:
-                        logger.debug(f"Retry attempt {attempt}/{max_retries} for {func.__name__}")
+                        logger.debug("Retry attempt %d/%d for %s", attempt, max_retries, func.__name__)
 
                     result = func(*args, **kwargs)
 
@@ -73,15 +96,12 @@ def retry_with_backoff(
                     last_exception = e
 
                     if attempt < max_retries:
-                        # Calculate backoff with exponential growth
-                        backoff = min(
-                            initial_backoff * (backoff_multiplier ** (attempt - 1)),
-                            max_backoff
-                        )
+                        # Backoff with exponential growth (precomputed)
+                        backoff = schedule[attempt - 1]
 
                         # Add jitter (randomness) to prevent thundering herd
                         if jitter:
-                            backoff = backoff * (0.5 + random.random())  # 50-150% of backoff
+                            backoff = backoff * (0.5 + _rand())  # 50-150% of backoff
 
                         logger.warning(
                             f"⚠️  {func.__name__} failed (attempt {attempt}/{max_retries}): {e}\n"
@@ -112,12 +132,10 @@ def retry_on_network_errors(func: Callable[..., T]) -> Callable[..., T]:
         def fetch_from_api():
             ...
     """
-    import httpx
-
     return retry_with_backoff(
         max_retries=3,
         initial_backoff=2,
-        exceptions=(httpx.HTTPError, TimeoutError, ConnectionError)
+        exceptions=_NETWORK_EXCEPTIONS
     )(func)
 
 
@@ -132,6 +150,12 @@ class RetryableOperation:
 
     def __init__(self, max_retries: int = RETRY_CONFIG['max_retries']):
         self.max_retries = max_retries
+        self._schedule = _backoff_schedule(
+            max_retries,
+            RETRY_CONFIG['initial_backoff_seconds'],
+            RETRY_CONFIG['max_backoff_seconds'],
+            RETRY_CONFIG['backoff_multiplier']
+        )
         self.attempts = 0
         self.last_error = None
 
@@ -152,14 +176,10 @@ class RetryableOperation:
                 self.last_error = e
 
                 if attempt < self.max_retries:
-                    backoff = min(
-                        RETRY_CONFIG['initial_backoff_seconds'] *
-                        (RETRY_CONFIG['backoff_multiplier'] ** (attempt - 1)),
-                        RETRY_CONFIG['max_backoff_seconds']
-                    )
+                    backoff = self._schedule[attempt - 1]
 
                     if RETRY_CONFIG['jitter']:
-                        backoff = backoff * (0.5 + random.random())
+                        backoff = backoff * (0.5 + _rand())
 
                     logger.warning(
                         f"Attempt {attempt} failed: {e}. "
@@ -2,14 +2,23 @@
 Agent Scheduler - Runs CVE and Darknet agents automatically.
 CVE collector runs ONCE PER DAY (not every hour - CVEs are published daily).
 """
+import asyncio
 import logging
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from Agents.CVECollectorAgent import CVECollectorAgent
-from Agents.DarknetNewsAgent import DarknetNewsAgent
-from Database.DatabaseManager import get_db
+from Database.DatabaseConfig import JOB_TIMEOUTS, get_config
+from Database.DatabaseManager import db_session
+
+if TYPE_CHECKING:
+    from Agents.DarknetNewsAgent import DarknetNewsAgent
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,10 +27,49 @@ logger = logging.getLogger(__name__)
 class AgentScheduler:
     """Manages automated agent execution"""
 
+    # Triggers are fixed, so they are built once. Up to a minute of jitter
+    # keeps runs from starting at exactly the same instant as other work
+    _CVE_TRIGGER = CronTrigger(hour=2, minute=0, jitter=60)  # Run at 2:00 AM daily
+    _DARKNET_TRIGGER = CronTrigger(hour='8,20', minute=0, jitter=60)  # Run at 8:00 AM and 8:00 PM
+    # Seconds stop() waits for runs in progress before giving up on them
+    _STOP_TIMEOUT = 30
+
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
-        self.cve_agent = CVECollectorAgent(model_name="llama3.2:3b")
-        self.darknet_agent = DarknetNewsAgent(model_name="llama3.2:3b")
+        # Jobs are scheduled on the caller's event loop; one run per job at a
+        # time, and missed runs collapse into a single catch-up run
+        self.scheduler = AsyncIOScheduler(
+            jobstores={'default': MemoryJobStore()},
+            job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600}
+        )
+        # Agent runs block (DB, HTTP, LLM), so they go to two worker threads
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-job")
+        # Worker future of each job's latest run (kept past a timeout)
+        self._running = {}
+        # Resolved once, so construction and scheduling always agree
+        self._darknet_enabled = get_config().darknet.enabled
+
+        # Agents are built on their first scheduled run, not at startup
+        self.cve_agent = None
+        self.darknet_agent = None
+        self._agent_lock = threading.Lock()
+
+    def _get_cve_agent(self) -> CVECollectorAgent:
+        """Get the CVE collector agent, creating it on first use"""
+        if self.cve_agent is None:
+            with self._agent_lock:
+                if self.cve_agent is None:
+                    self.cve_agent = CVECollectorAgent(model_name="llama3.2:3b")
+        return self.cve_agent
+
+    def _get_darknet_agent(self) -> "DarknetNewsAgent":
+        """Get the darknet scraper agent, creating it on first use"""
+        if self.darknet_agent is None:
+            with self._agent_lock:
+                if self.darknet_agent is None:
+                    # Imported here: only needed when darknet scraping is enabled
+                    from Agents.DarknetNewsAgent import DarknetNewsAgent
+                    self.darknet_agent = DarknetNewsAgent(model_name="llama3.2:3b")
+        return self.darknet_agent
 
     def start(self):
         """Start scheduled agent jobs"""
@@ -31,63 +79,124 @@ class AgentScheduler:
         # CVEs are published daily, no need to check every hour
         self.scheduler.add_job(
             func=self._run_cve_agent,
-            trigger=CronTrigger(hour=2, minute=0),  # Run at 2:00 AM daily
+            trigger=self._CVE_TRIGGER,
             id='cve_collector',
             name='CVE Collector Agent (Daily)',
-            replace_existing=True
+            replace_existing=True,
+            jobstore='default',
+            coalesce=True,
+            max_instances=1
         )
 
         # Schedule darknet scraper - TWICE PER DAY (morning and evening)
-        self.scheduler.add_job(
-            func=self._run_darknet_agent,
-            trigger=CronTrigger(hour='8,20', minute=0),  # Run at 8:00 AM and 8:00 PM
-            id='darknet_scraper',
-            name='Darknet News Scraper (2x daily)',
-            replace_existing=True
-        )
+        if self._darknet_enabled:
+            self.scheduler.add_job(
+                func=self._run_darknet_agent,
+                trigger=self._DARKNET_TRIGGER,
+                id='darknet_scraper',
+                name='Darknet News Scraper (2x daily)',
+                replace_existing=True,
+                jobstore='default',
+                coalesce=True,
+                max_instances=1
+            )
 
         self.scheduler.start()
         logger.info("✓ Scheduler started")
         logger.info("  📡 CVE Collector: Daily at 2:00 AM")
-        logger.info("  🕵️ Darknet Scraper: 2x daily (8 AM, 8 PM)")
-
-    def _run_cve_agent(self):
-        """Execute CVE collector agent"""
+        if self._darknet_enabled:
+            logger.info("  🕵️ Darknet Scraper: 2x daily (8 AM, 8 PM)")
+        else:
+            logger.info("  🕵️ Darknet Scraper: disabled (DARKNET_ENABLED=false)")
+
+    async def _run_cve_agent(self):
+        """Execute CVE collector agent off the event loop"""
+        await self._run_in_worker("cve_agent", self._collect_cves)
+
+    async def _run_darknet_agent(self):
+        """Execute darknet scraper agent off the event loop"""
+        await self._run_in_worker("darknet_agent", self._scrape_darknet)
+
+    async def _run_in_worker(self, job_name: str, func):
+        """
+        Run a blocking job function on a worker thread and wait up to its timeout.
+
+        A thread can't be cancelled, so a run that exceeds its JOB_TIMEOUTS
+        window is only logged and left to finish; the job's next run is
+        skipped while it is still going.
+
+        Args:
+            job_name (str): Key into JOB_TIMEOUTS
+            func: Job function to run on the worker thread
+        """
+        previous = self._running.get(job_name)
+        if previous is not None and not previous.done():
+            logger.warning("⚠️  %s still running from a previous run, skipping", job_name)
+            return
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, func)
+        self._running[job_name] = future
+        timeout = JOB_TIMEOUTS[job_name].total_seconds()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️  %s exceeded its %.0fs timeout, still running", job_name, timeout)
+
+    def _collect_cves(self):
+        """Run the CVE collector (worker thread)"""
         logger.info("⏰ Running scheduled CVE collection...")
-        with get_db() as db:
+        with db_session() as db:
             try:
-                result = self.cve_agent.run(db)
-                logger.info(f"✓ CVE collection: {result}")
+                result = self._get_cve_agent().run(db)
+                logger.info("✓ CVE collection: %s", result)
             except Exception as e:
-                logger.error(f"✗ CVE collection failed: {e}")
+                logger.error("✗ CVE collection failed: %s", e)
 
-    def _run_darknet_agent(self):
-        """Execute darknet scraper agent"""
+    def _scrape_darknet(self):
+        """Run the darknet scraper (worker thread)"""
         logger.info("⏰ Running scheduled darknet scraping...")
-        with get_db() as db:
+        with db_session() as db:
             try:
-                result = self.darknet_agent.run(db)
-                logger.info(f"✓ Darknet scraping: {result}")
+                result = self._get_darknet_agent().run(db)
+                logger.info("✓ Darknet scraping: %s", result)
             except Exception as e:
-                logger.error(f"✗ Darknet scraping failed: {e}")
+                logger.error("✗ Darknet scraping failed: %s", e)
 
-    def stop(self):
-        """Stop scheduler"""
+    async def stop(self):
+        """Stop scheduler, giving runs in progress up to _STOP_TIMEOUT seconds to finish"""
         self.scheduler.shutdown()
+        # Await runs on the loop (which is still alive) instead of blocking it
+        running = [future for future in self._running.values() if not future.done()]
+        if running:
+            logger.info("Waiting for %d running job(s) to finish...", len(running))
+            _, pending = await asyncio.wait(running, timeout=self._STOP_TIMEOUT)
+            if pending:
+                logger.warning("⚠️  %d job(s) still running after %ds, not waiting for them",
+                               len(pending), self._STOP_TIMEOUT)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # A CVE run that outlived the wait may still be using the agent
+        cve_run = self._running.get("cve_agent")
+        if self.cve_agent is not None and (cve_run is None or cve_run.done()):
+            self.cve_agent.close()
         logger.info("✓ Scheduler stopped")
 
 
-def run_scheduler():
-    """Main entry point"""
+async def _serve_scheduler():
+    """Run the scheduler on the current event loop until SIGINT/SIGTERM"""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
     scheduler = AgentScheduler()
     scheduler.start()
+    await stop.wait()
+    await scheduler.stop()
 
-    try:
-        import time
-        while True:
-            time.sleep(60)
-    except (KeyboardInterrupt, SystemExit):
-        scheduler.stop()
+
+def run_scheduler():
+    """Main entry point"""
+    asyncio.run(_serve_scheduler())
 
 
 if __name__ == "__main__":
@@ -2,20 +2,22 @@
 Main entry point:  start API server and scheduler with local Ollama model.
 No API costs, everything runs locally!
 """
+import argparse
+import atexit
 import logging
 import os
 import sys
 import asyncio
-import threading
-import time
+import contextlib
+import importlib
+import signal
+from typing import Optional
+import httpx
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from uvicorn import Config, Server
-from app.Scheduler import AgentScheduler
-from app.API import app as api_app
-from Database.database import init_db
-from threading import Thread
-from Dashboard.Dashboard import app as dash_app
+# The agents, API, dashboard and database modules are imported after the
+# Ollama check, so a failed launch doesn't pay for loading them
 
 load_dotenv()
 
@@ -25,39 +27,130 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Settings are read from the environment once, at startup
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", 8000))
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+
+# Keep-alive client for the local Ollama server
+HTTP = httpx.Client(
+    base_url="http://localhost:11434",
+    timeout=5,
+    limits=httpx.Limits(max_keepalive_connections=8)
+)
+atexit.register(HTTP.close)
+
 app = FastAPI()
 
 @app.get("/")
 async def root():
     return {"message": "ACSD API is running"}
 
-def run_dash():
-    """Run Dash dashboard in a separate thread"""
-    dash_app.run(debug=False, host="0.0.0.0", port=8050)
+class _Server(Server):
+    """uvicorn Server that leaves signal handling to main() (several servers share one loop)"""
+
+    def install_signal_handlers(self):  # uvicorn < 0.29
+        pass
+
+    @contextlib.contextmanager
+    def capture_signals(self):  # uvicorn >= 0.29
+        yield
+
+def create_api_server() -> Server:
+    """Create the FastAPI server (kept so it can be told to exit on shutdown)"""
+    from app.API import app as api_app
 
-def run_api_server():
-    """Run FastAPI server in a thread"""
     config = Config(
         app=api_app,
-        host=os.getenv("API_HOST", "0.0.0.0"),
-        port=int(os.getenv("API_PORT", 8000)),
+        host=API_HOST,
+        port=API_PORT,
         log_level="info"
     )
-    server = Server(config)
-    asyncio.run(server.serve())
+    return _Server(config)
+
+def create_dash_server() -> Optional[Server]:
+    """Serve the Dash (Flask/WSGI) app as ASGI on the same event loop as the API"""
+    try:
+        dashboard = importlib.import_module("Dashboard.Dashboard")
+        wsgi = importlib.import_module("a2wsgi")
+    except ImportError as e:
+        logger.warning(f"⚠️ Dashboard disabled (missing dependency: {e.name})")
+        return None
+
+    # a2wsgi runs each request on its own worker thread, so a slow callback
+    # (callbacks call the API over HTTP) doesn't hold up the others
+    config = Config(
+        app=wsgi.WSGIMiddleware(dashboard.app.server, workers=10),
+        host="0.0.0.0",
+        port=8050,
+        log_level="warning"
+    )
+    return _Server(config)
+
+async def serve(model_name: str, with_dashboard: bool = False):
+    """Run the API server, scheduler and (optionally) dashboard on a single event loop"""
+    loop = asyncio.get_running_loop()
+
+    # Block without polling; SIGINT/SIGTERM wake the wait immediately
+    stop_event = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    from app.Scheduler import AgentScheduler
+
+    # Start task scheduler with Ollama model
+    scheduler = AgentScheduler()
+    scheduler.start()
+    logger.info("✓ Task scheduler started")
+
+    api_server = create_api_server()
+    dash_server = create_dash_server() if with_dashboard else None
+    servers = asyncio.gather(*(server.serve() for server in (api_server, dash_server) if server))
+    logger.info(f"✓ API server started (http://{API_HOST}:{API_PORT})")
+
+    logger.info("\n" + "="*60)
+    logger.info("CVE Intelligence System is running!")
+    logger.info("="*60)
+    logger.info(f"API Docs:        http://localhost:{API_PORT}/docs")
+    if dash_server:
+        logger.info(f"Dashboard:      http://localhost:8050")
+    logger.info(f"Ollama Model:   {model_name}")
+    logger.info("="*60 + "\n")
+
+    await stop_event.wait()
+
+    logger.info("Shutting down...")
+    await scheduler.stop()
+    api_server.should_exit = True
+    if dash_server:
+        dash_server.should_exit = True
+    await servers
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="CVE Intelligence System")
+    parser.add_argument("--with-dashboard", action="store_true",
+                        help="also serve the Dash dashboard on port 8050")
+    args = parser.parse_args(argv)
 
-if __name__ == "__main__":
     logger.info("Starting CVE Intelligence System with LOCAL Ollama Models...")
 
     # Which Ollama model to use
     # Options: mistral, llama2, neural-chat, orca-mini, etc.
-    model_name = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+    model_name = OLLAMA_MODEL
     logger.info(f"Using Ollama model: {model_name}")
 
     # Check if Ollama is running
     try:
-        import httpx
-        response = httpx.get("http://localhost:11434/api/tags", timeout=5)
+        response = HTTP.get("/api/tags")
         if response.status_code == 200:
             logger.info("✓ Ollama is running and accessible")
         else:
@@ -66,38 +159,22 @@ if __name__ == "__main__":
         logger.error(f"✗ Ollama not accessible at localhost:11434")
         logger.error(f"  Make sure to run:  ollama serve")
         logger.error(f"  Error: {e}")
-        sys.exit(1)
+        return 1
 
     # Initialize database
+    from Database.DatabaseManager import init_db
     init_db()
     logger.info("✓ Database initialized")
 
-    # Start task scheduler with Ollama model
-    scheduler = AgentScheduler()
-    scheduler.start()
-    logger.info("✓ Task scheduler started")
-
-    # Start FastAPI server
-    api_thread = threading.Thread(target=run_api_server, daemon=False)
-    api_thread.start()
-    logger.info("✓ API server started (http://0.0.0.0:8000)")
-
-    logger.info("\n" + "="*60)
-    logger.info("CVE Intelligence System is running!")
-    logger.info("="*60)
-    logger.info(f"API Docs:        http://localhost:8000/docs")
-
-    logger.info(f"Ollama Model:   {model_name}")
-    logger.info("="*60 + "\n")
-
-    dash_thread = Thread(target=run_dash, daemon=True)
-    dash_thread.start()
-    logger.info(f"Dashboard:      http://localhost:8050")
-
+    # Awaiting Server.serve() keeps whatever loop it runs on, so uvloop
+    # (installed with uvicorn[standard]) has to be chosen here
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Shutting down...")
-        scheduler.stop()
-        sys.exit(0)
\ No newline at end of file
+        import uvloop
+    except ImportError:
+        asyncio.run(serve(model_name, with_dashboard=args.with_dashboard))
+    else:
+        uvloop.run(serve(model_name, with_dashboard=args.with_dashboard))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,4 +21,4 @@ sudo systemctl start postgresql
 # alembic upgrade head
 
 # Start the system (API + Scheduler + Dashboard)
-python main.py
+python main.py --with-dashboard